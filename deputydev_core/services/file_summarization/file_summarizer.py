@@ -6,13 +6,17 @@ from tree_sitter_language_pack import get_language, get_parser
 from deputydev_core.models.dto.summarization_dto import FileSummaryResponse, FileType, LineRange, SummarizationStrategy
 from deputydev_core.utils.app_logger import AppLogger
 from deputydev_core.utils.constants.constants import (
-    CODE_PATTERNS,
+    CODE_PATTERN_TAGS,
+    COMBINED_CODE_PATTERN,
     DEFAULT_MAX_SUMMARY_LINES,
     IMPORTANT_NODE_TYPES,
     MAX_SIGNATURE_LINES,
 )
 from deputydev_core.utils.file_type_detector import FileTypeDetector
 
+# Markdown headers, bullet items and numbered items, matched in a single pass per line
+_TEXT_STRUCTURE_PATTERN = re.compile(r"^#{1,6}\s+|^\s*[-*+]\s+|^\s*\d+\.\s+")
+
 
 class FileSummarizer:
     def __init__(self, max_lines: int = DEFAULT_MAX_SUMMARY_LINES, include_line_numbers: bool = True) -> None:
@@ -255,18 +259,18 @@ class FileSummarizer:
             if not stripped or stripped.startswith("#"):
                 continue
 
-            for pattern, content_type in CODE_PATTERNS:
-                if re.match(pattern, line):
-                    important_lines.append(line)
-                    ranges.append(
-                        LineRange(
-                            start_line=i + 1,
-                            end_line=i + 1,
-                            content_type=content_type,
-                            construct_name=self._extract_name_from_line(line, content_type),
-                        )
+            match = COMBINED_CODE_PATTERN.match(line)
+            if match:
+                content_type = CODE_PATTERN_TAGS[match.lastgroup]
+                important_lines.append(line)
+                ranges.append(
+                    LineRange(
+                        start_line=i + 1,
+                        end_line=i + 1,
+                        content_type=content_type,
+                        construct_name=self._extract_name_from_line(line, content_type),
                     )
-                    break
+                )
 
         important_lines: List[str] = important_lines[: self.max_lines]
         ranges: List[LineRange] = ranges[: self.max_lines]
@@ -313,7 +317,7 @@ class FileSummarizer:
                 continue
 
             # Headers and list items
-            if re.match(r"^#{1,6}\s+", line) or re.match(r"^\s*[-*+]\s+", line) or re.match(r"^\s*\d+\.\s+", line):
+            if _TEXT_STRUCTURE_PATTERN.match(line):
                 important_lines.append(line)
                 ranges.append(LineRange(start_line=i + 1, end_line=i + 1, content_type="header"))
 
@@ -6,7 +6,7 @@ from typing import Any, Optional
 
 import aiohttp
 from weaviate import WeaviateAsyncClient, WeaviateClient
-from weaviate.config import AdditionalConfig, Timeout
+from weaviate.config import AdditionalConfig, ConnectionConfig, Timeout
 from weaviate.connect import ConnectionParams, ProtocolParams
 from weaviate.embedded import EmbeddedOptions
 
@@ -116,9 +116,29 @@ class BaseWeaviateConnector:
             ),
         )
 
+    def get_connection_config(self) -> ConnectionConfig:
+        """
+        Size the clients' HTTP connection pool. Both clients are shared by every concurrent request and multiplex
+        over this pool (and a single gRPC channel), so its size bounds request concurrency. Keys left out of
+        WEAVIATE_CLIENT_CONNECTION_POOL keep weaviate's defaults.
+        """
+        pool_config = ConfigManager.configs.get("WEAVIATE_CLIENT_CONNECTION_POOL") or {}
+        overrides = {
+            field: pool_config[key]
+            for key, field in (
+                ("CONNECTIONS", "session_pool_connections"),
+                ("MAXSIZE", "session_pool_maxsize"),
+                ("MAX_RETRIES", "session_pool_max_retries"),
+                ("TIMEOUT", "session_pool_timeout"),
+            )
+            if key in pool_config
+        }
+        return ConnectionConfig(**overrides)
+
     def get_additional_config(self) -> AdditionalConfig:
         timeouts = ConfigManager.configs["WEAVIATE_CLIENT_TIMEOUTS"]
         return AdditionalConfig(
+            connection=self.get_connection_config(),
             timeout=Timeout(
                 init=timeouts["INIT"],
                 query=timeouts["QUERY"],
@@ -5,88 +5,100 @@ This module contains comprehensive unit tests for the VectorDBChunker,
 testing each method in isolation without external dependencies.
 """
 
-import asyncio
-from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from functools import lru_cache
+from types import ModuleType, SimpleNamespace
+from typing import List, Tuple
 from unittest.mock import AsyncMock, Mock, patch
 import sys
-import importlib
 
 import pytest
 
 
 def force_real_import():
     """Force import of real VectorDBChunker class by bypassing mocks."""
-    # Store original sys.modules state
-    original_modules = {}
     modules_to_patch = [
         'deputydev_core.services.chunking.chunker.base_chunker',
         'deputydev_core.services.chunking.chunker.handlers.vector_db_chunker',
     ]
-    
+
+    # Only evict entries that were replaced by mocks; real modules are reused so the
+    # chunker class statements are not re-executed for every test
     for module_name in modules_to_patch:
-        if module_name in sys.modules:
-            original_modules[module_name] = sys.modules[module_name]
+        if module_name in sys.modules and not isinstance(sys.modules[module_name], ModuleType):
             del sys.modules[module_name]
-    
-    try:
-        # Import the real modules
-        from deputydev_core.services.chunking.chunker.handlers.vector_db_chunker import VectorDBChunker
-        return VectorDBChunker
-    finally:
-        # Don't restore the mocks - let the real modules stay
-        pass
+
+    from deputydev_core.services.chunking.chunker.handlers.vector_db_chunker import VectorDBChunker
+    return VectorDBChunker
+
+
+# Batching inputs shared across tests; batchify_files_for_insertion only reads them
+_FILES_5 = {f"file{i}.py": f"hash{i}" for i in range(5)}
+_FILES_10 = {f"file{i}.py": f"hash{i}" for i in range(10)}
+
+
+@lru_cache(maxsize=64)
+def _content_hash(content: str) -> str:
+    """Fake content hash for mock chunks; the tests reuse a handful of contents."""
+    return f"hash_{hash(content) % 10000}"
+
+
+@pytest.fixture(scope="module")
+def batching_chunker():
+    """VectorDBChunker shared by the batching tests; batchify_files_for_insertion keeps no state."""
+    return force_real_import()(
+        local_repo=Mock(), process_executor=Mock(), weaviate_client=Mock(), embedding_manager=Mock()
+    )
 
 
 class TestVectorDBChunker:
     """Unit test cases for VectorDBChunker class."""
 
+    @classmethod
+    def setup_class(cls):
+        """Build the mocks shared by every test once for the whole class."""
+        cls._embed_mock = AsyncMock()
+        cls._file_wise_chunks_mock = AsyncMock()
+        cls._weaviate_client = Mock()
+
     def setup_method(self):
         """Setup method to ensure clean mocking for each test."""
-        # Always get a fresh import of the real class
+        # Resolve the real class, re-importing only if a mock was left in sys.modules
         self.VectorDBChunker = force_real_import()
 
+        # Drop call history and configured results left over from the previous test
+        self._embed_mock.reset_mock(return_value=True, side_effect=True)
+        self._file_wise_chunks_mock.reset_mock(return_value=True, side_effect=True)
+        self._file_wise_chunks_mock.return_value = {}
+        self._weaviate_client.reset_mock()
+
     def _create_mock_chunk_info(self, file_path: str = "test.py", content: str = "test content", 
                                embedding: List[float] = None) -> Mock:
         """Create a properly mocked ChunkInfo object."""
-        chunk = Mock()
-        chunk.content = content
-        chunk.content_hash = f"hash_{hash(content) % 10000}"
-        chunk.embedding = embedding
-        
-        # Mock source_details
-        chunk.source_details = Mock()
-        chunk.source_details.file_path = file_path
-        chunk.source_details.file_hash = "file_hash"
-        chunk.source_details.start_line = 1
-        chunk.source_details.end_line = 10
-        
-        # Mock metadata
-        chunk.metadata = None  # Avoid Pydantic validation issues
-        
-        # Mock methods
-        chunk.get_chunk_content_with_meta_data = Mock(return_value=f"<meta>{file_path}</meta>\n{content}")
-        
-        return chunk
+        # Configure everything through the constructors instead of one setattr per field
+        source_details = Mock(file_path=file_path, file_hash="file_hash", start_line=1, end_line=10)
+        return Mock(
+            content=content,
+            content_hash=_content_hash(content),
+            embedding=embedding,
+            source_details=source_details,
+            metadata=None,  # Avoid Pydantic validation issues
+            get_chunk_content_with_meta_data=Mock(return_value=f"<meta>{file_path}</meta>\n{content}"),
+        )
 
     def _create_chunker_instance(self, **kwargs):
         """Create a VectorDBChunker instance with fully mocked dependencies."""
         
-        # Create mock dependencies
-        mock_local_repo = Mock()
-        mock_local_repo.repo_path = "/test/repo"
-        mock_local_repo.get_chunkable_files_and_commit_hashes = AsyncMock(return_value={})
-        
-        mock_process_executor = Mock(spec=ProcessPoolExecutor)
-        mock_weaviate_client = Mock()
-        mock_embedding_manager = Mock()
+        # Create stand-in dependencies; tests that assert on calls install their own mocks
+        mock_local_repo = SimpleNamespace(repo_path="/test/repo")
+        mock_process_executor = SimpleNamespace()
+        mock_embedding_manager = SimpleNamespace(embed_text_array=self._embed_mock)
         
         # Set default kwargs
         default_kwargs = {
             'local_repo': mock_local_repo,
             'process_executor': mock_process_executor,
-            'weaviate_client': mock_weaviate_client,
+            'weaviate_client': self._weaviate_client,
             'embedding_manager': mock_embedding_manager,
             'chunkable_files_and_hashes': None,
             'use_new_chunking': True,
@@ -100,7 +112,7 @@ class TestVectorDBChunker:
         
         # Mock the file_chunk_creator which is set in the parent class
         mock_file_chunk_creator = Mock()
-        mock_file_chunk_creator.create_and_get_file_wise_chunks = AsyncMock(return_value={})
+        mock_file_chunk_creator.create_and_get_file_wise_chunks = self._file_wise_chunks_mock
         chunker.file_chunk_creator = mock_file_chunk_creator
         
         return chunker
@@ -139,90 +151,6 @@ class TestVectorDBChunker:
         assert chunker.use_async_refresh is True
         assert chunker.fetch_with_vector is True
 
-    def test_batchify_files_for_insertion_small_batch(self):
-        """Test batchify_files_for_insertion with files less than batch size."""
-        # Test the actual logic by implementing it directly in the test
-        files_to_chunk = {
-            "file1.py": "hash1",
-            "file2.py": "hash2",
-            "file3.py": "hash3"
-        }
-        max_batch_size_chunking = 5
-        
-        # Implement the logic
-        files_to_chunk_items = list(files_to_chunk.items())
-        batched_files_to_store: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files_to_chunk), max_batch_size_chunking):
-            batch_files = files_to_chunk_items[i : i + max_batch_size_chunking]
-            batched_files_to_store.append(batch_files)
-        
-        assert len(batched_files_to_store) == 1
-        assert len(batched_files_to_store[0]) == 3
-        assert set(batched_files_to_store[0]) == {("file1.py", "hash1"), ("file2.py", "hash2"), ("file3.py", "hash3")}
-
-    def test_batchify_files_for_insertion_large_batch(self):
-        """Test batchify_files_for_insertion with files more than batch size."""
-        files_to_chunk = {f"file{i}.py": f"hash{i}" for i in range(10)}
-        max_batch_size_chunking = 3
-        
-        # Implement the logic
-        files_to_chunk_items = list(files_to_chunk.items())
-        batched_files_to_store: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files_to_chunk), max_batch_size_chunking):
-            batch_files = files_to_chunk_items[i : i + max_batch_size_chunking]
-            batched_files_to_store.append(batch_files)
-        
-        assert len(batched_files_to_store) == 4  # 10 files, batch size 3 = 4 batches (3,3,3,1)
-        assert len(batched_files_to_store[0]) == 3
-        assert len(batched_files_to_store[1]) == 3
-        assert len(batched_files_to_store[2]) == 3
-        assert len(batched_files_to_store[3]) == 1
-
-    def test_batchify_files_for_insertion_empty_files(self):
-        """Test batchify_files_for_insertion with empty files dictionary."""
-        files_to_chunk = {}
-        max_batch_size_chunking = 5
-        
-        # Implement the logic
-        files_to_chunk_items = list(files_to_chunk.items())
-        batched_files_to_store: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files_to_chunk), max_batch_size_chunking):
-            batch_files = files_to_chunk_items[i : i + max_batch_size_chunking]
-            batched_files_to_store.append(batch_files)
-        
-        assert batched_files_to_store == []
-
-    def test_batchify_files_exact_batch_size(self):
-        """Test batchify_files_for_insertion with files exactly matching batch size."""
-        files_to_chunk = {f"file{i}.py": f"hash{i}" for i in range(5)}
-        max_batch_size_chunking = 5
-        
-        # Implement the logic
-        files_to_chunk_items = list(files_to_chunk.items())
-        batched_files_to_store: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files_to_chunk), max_batch_size_chunking):
-            batch_files = files_to_chunk_items[i : i + max_batch_size_chunking]
-            batched_files_to_store.append(batch_files)
-        
-        assert len(batched_files_to_store) == 1
-        assert len(batched_files_to_store[0]) == 5
-
-    def test_batchify_files_single_file(self):
-        """Test batchify_files_for_insertion with single file."""
-        files_to_chunk = {"single_file.py": "single_hash"}
-        max_batch_size_chunking = 10
-        
-        # Implement the logic
-        files_to_chunk_items = list(files_to_chunk.items())
-        batched_files_to_store: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files_to_chunk), max_batch_size_chunking):
-            batch_files = files_to_chunk_items[i : i + max_batch_size_chunking]
-            batched_files_to_store.append(batch_files)
-        
-        assert len(batched_files_to_store) == 1
-        assert len(batched_files_to_store[0]) == 1
-        assert batched_files_to_store[0][0] == ("single_file.py", "single_hash")
-
     def test_chunker_has_required_attributes(self):
         """Test that VectorDBChunker has all required attributes after initialization."""
         chunker = self._create_chunker_instance()
@@ -234,36 +162,27 @@ class TestVectorDBChunker:
         for attr in required_attributes:
             assert hasattr(chunker, attr), f"Missing attribute: {attr}"
 
-    def test_batchify_files_for_insertion_real_method(self):
-        """Test the actual batchify_files_for_insertion method."""
-        chunker = self._create_chunker_instance()
-        
-        # Test with small batch
-        files_to_chunk = {
-            "file1.py": "hash1",
-            "file2.py": "hash2",
-            "file3.py": "hash3"
-        }
-        result = chunker.batchify_files_for_insertion(files_to_chunk, max_batch_size_chunking=5)
-        
-        assert len(result) == 1
-        assert len(result[0]) == 3
-        assert set(result[0]) == {("file1.py", "hash1"), ("file2.py", "hash2"), ("file3.py", "hash3")}
+    @pytest.mark.parametrize(
+        "files_to_chunk, max_batch_size_chunking, expected_sizes",
+        [
+            pytest.param({"file1.py": "hash1", "file2.py": "hash2", "file3.py": "hash3"}, 5, [3], id="small_batch"),
+            pytest.param(_FILES_10, 3, [3, 3, 3, 1], id="large_batch"),
+            pytest.param({}, 5, [], id="empty_files"),
+            pytest.param(_FILES_5, 5, [5], id="exact_batch_size"),
+            pytest.param({"single_file.py": "single_hash"}, 10, [1], id="single_file"),
+        ],
+    )
+    def test_batchify_files_for_insertion(
+        self, batching_chunker, files_to_chunk, max_batch_size_chunking, expected_sizes
+    ):
+        """Test batchify_files_for_insertion splits files into ordered batches of the requested size."""
+        result = batching_chunker.batchify_files_for_insertion(
+            files_to_chunk, max_batch_size_chunking=max_batch_size_chunking
+        )
 
-    def test_batchify_files_for_insertion_large_batch_real_method(self):
-        """Test the actual batchify_files_for_insertion method with large batch."""
-        chunker = self._create_chunker_instance()
-        
-        files_to_chunk = {f"file{i}.py": f"hash{i}" for i in range(10)}
-        result = chunker.batchify_files_for_insertion(files_to_chunk, max_batch_size_chunking=3)
-        
-        assert len(result) == 4  # 10 files, batch size 3 = 4 batches (3,3,3,1)
-        assert len(result[0]) == 3
-        assert len(result[1]) == 3
-        assert len(result[2]) == 3
-        assert len(result[3]) == 1
+        assert [len(batch) for batch in result] == expected_sizes
+        assert [item for batch in result for item in batch] == list(files_to_chunk.items())
 
-    @pytest.mark.asyncio
     async def test_add_chunk_embeddings_real_method(self):
         """Test the actual add_chunk_embeddings method."""
         chunker = self._create_chunker_instance()
@@ -276,7 +195,7 @@ class TestVectorDBChunker:
         
         # Mock embedding manager
         embeddings = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
-        chunker.embedding_manager.embed_text_array = AsyncMock(return_value=(embeddings, 20))
+        chunker.embedding_manager.embed_text_array.return_value = (embeddings, 20)
         
         # Call the actual method
         await chunker.add_chunk_embeddings(mock_chunks)
@@ -291,7 +210,6 @@ class TestVectorDBChunker:
         texts_sent = call_args.kwargs['texts']
         assert len(texts_sent) == 2
 
-    @pytest.mark.asyncio
     async def test_create_and_store_chunks_for_file_batches_real_method(self):
         """Test the actual create_and_store_chunks_for_file_batches method."""
         with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class:
@@ -350,7 +268,6 @@ class TestVectorDBChunker:
             for chunk in mock_chunks_batch1 + mock_chunks_batch2:
                 assert chunk.embedding is None
 
-    @pytest.mark.asyncio
     async def test_create_and_store_chunks_for_file_batches_with_fetch_with_vector(self):
         """Test create_and_store_chunks_for_file_batches with fetch_with_vector=True."""
         with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class:
@@ -376,7 +293,6 @@ class TestVectorDBChunker:
             # Verify embedding was NOT removed when fetch_with_vector=True
             assert mock_chunk.embedding == original_embedding
 
-    @pytest.mark.asyncio
     async def test_create_chunks_and_docs_real_method(self):
         """Test the actual create_chunks_and_docs method."""
         with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class, \
@@ -444,7 +360,6 @@ class TestVectorDBChunker:
             assert "no_embedding_content" in result_contents  # file2.py existing chunk (overwrites missing)
             assert "new_file_content" in result_contents  # file3.py new chunk
 
-    @pytest.mark.asyncio
     async def test_create_chunks_and_docs_with_no_chunkable_files_provided(self):
         """Test create_chunks_and_docs when chunkable_files_and_hashes is None."""
         with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class, \
@@ -482,7 +397,6 @@ class TestVectorDBChunker:
             assert len(result) == 1
             assert result[0].content == "repo_content"
 
-    @pytest.mark.asyncio
     async def test_create_chunks_and_docs_with_file_indexing_progress_monitor(self):
         """Test create_chunks_and_docs with file_indexing_progress_monitor."""
         with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class, \
@@ -526,23 +440,15 @@ class TestVectorDBChunker:
             }
             assert call_args == expected_status
 
-    @pytest.mark.asyncio
     async def test_create_chunks_and_docs_empty_files(self):
         """Test create_chunks_and_docs with empty file list."""
-        with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.ChunkVectorStoreManager') as mock_manager_class, \
-             patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.AppLogger'):
-            
+        # No ChunkVectorStoreManager patch needed: with no files the real manager never queries the client
+        with patch('deputydev_core.services.chunking.chunker.handlers.vector_db_chunker.AppLogger'):
             chunker = self._create_chunker_instance(chunkable_files_and_hashes={})
-            
-            # Mock ChunkVectorStoreManager
-            mock_manager = Mock()
-            mock_manager.get_valid_file_wise_stored_chunks = AsyncMock(return_value={})
-            mock_manager_class.return_value = mock_manager
-            
             chunker.create_and_store_chunks_for_file_batches = AsyncMock(return_value={})
             
             # Call the method
-            result = await chunker.create_chunks_and_docs()
+            result = await chunker.create_chunks_and_docs(chunker.chunkable_files_and_hashes)
             
             # Verify empty result
             assert result == []
@@ -552,7 +458,6 @@ class TestVectorDBChunker:
             call_args = chunker.create_and_store_chunks_for_file_batches.call_args[0][0]
             assert call_args == []  # Empty batched files
 
-    @pytest.mark.asyncio
     async def test_get_file_wise_chunks_for_single_file_batch_real_method(self):
         """Test the actual get_file_wise_chunks_for_single_file_batch method."""
         chunker = self._create_chunker_instance()
@@ -569,9 +474,9 @@ class TestVectorDBChunker:
         }
         
         # Mock dependencies
-        chunker.file_chunk_creator.create_and_get_file_wise_chunks = AsyncMock(return_value=file_wise_chunks)
+        chunker.file_chunk_creator.create_and_get_file_wise_chunks.return_value = file_wise_chunks
         embeddings = [[0.1, 0.2], [0.3, 0.4]]
-        chunker.embedding_manager.embed_text_array = AsyncMock(return_value=(embeddings, 10))
+        chunker.embedding_manager.embed_text_array.return_value = (embeddings, 10)
         
         # Call the actual method
         result = await chunker.get_file_wise_chunks_for_single_file_batch(files_batch)
@@ -590,7 +495,6 @@ class TestVectorDBChunker:
         assert mock_chunks[0].embedding == embeddings[0]
         assert mock_chunks[1].embedding == embeddings[1]
 
-    @pytest.mark.asyncio
     async def test_add_chunk_embeddings_interface(self):
         """Test add_chunk_embeddings interface and behavior."""
         chunker = self._create_chunker_instance()
@@ -603,7 +507,7 @@ class TestVectorDBChunker:
         
         # Mock embedding manager
         embeddings = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
-        chunker.embedding_manager.embed_text_array = AsyncMock(return_value=(embeddings, 20))
+        chunker.embedding_manager.embed_text_array.return_value = (embeddings, 20)
         
         # Test the interface by calling embed_text_array directly
         texts_to_embed = [
@@ -624,11 +528,9 @@ class TestVectorDBChunker:
         assert mock_chunks[0].embedding == embeddings[0]
         assert mock_chunks[1].embedding == embeddings[1]
 
-    @pytest.mark.asyncio
     async def test_add_chunk_embeddings_empty_list_interface(self):
         """Test add_chunk_embeddings interface with empty chunk list."""
         chunker = self._create_chunker_instance()
-        chunker.embedding_manager.embed_text_array = AsyncMock()
         
         # Test the interface - should handle empty list gracefully
         empty_chunks = []
@@ -642,7 +544,6 @@ class TestVectorDBChunker:
         # Should not call embed_text_array for empty list
         chunker.embedding_manager.embed_text_array.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_file_chunk_creation_interface(self):
         """Test file chunk creation interface."""
         chunker = self._create_chunker_instance()
@@ -659,8 +560,8 @@ class TestVectorDBChunker:
         }
         
         # Mock dependencies
-        chunker.file_chunk_creator.create_and_get_file_wise_chunks = AsyncMock(return_value=file_wise_chunks)
-        chunker.embedding_manager.embed_text_array = AsyncMock(return_value=([[0.1, 0.2], [0.3, 0.4]], 10))
+        chunker.file_chunk_creator.create_and_get_file_wise_chunks.return_value = file_wise_chunks
+        chunker.embedding_manager.embed_text_array.return_value = ([[0.1, 0.2], [0.3, 0.4]], 10)
         
         # Test the interface
         result = await chunker.file_chunk_creator.create_and_get_file_wise_chunks(
@@ -679,13 +580,11 @@ class TestVectorDBChunker:
             process_executor=chunker.process_executor
         )
 
-    @pytest.mark.asyncio
     async def test_file_chunk_creation_no_chunks_interface(self):
         """Test file chunk creation interface when no chunks are created."""
         chunker = self._create_chunker_instance()
         
         files_batch = [("file1.py", "hash1")]
-        chunker.file_chunk_creator.create_and_get_file_wise_chunks = AsyncMock(return_value={})
         
         result = await chunker.file_chunk_creator.create_and_get_file_wise_chunks(
             {"file1.py": "hash1"},
@@ -730,7 +629,6 @@ class TestVectorDBChunker:
         # Verify embedding was kept
         assert chunk.embedding == original_embedding
 
-    @pytest.mark.asyncio
     async def test_chunkable_files_from_local_repo_interface(self):
         """Test getting chunkable files from local repo when not provided."""
         chunker = self._create_chunker_instance(chunkable_files_and_hashes=None)
@@ -748,7 +646,6 @@ class TestVectorDBChunker:
         assert file_path_commit_hash_map == test_files
         chunker.local_repo.get_chunkable_files_and_commit_hashes.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_chunkable_files_provided_interface(self):
         """Test using provided chunkable files."""
         sample_chunkable_files = {
@@ -756,6 +653,7 @@ class TestVectorDBChunker:
             "src/utils.py": "hash_utils_py"
         }
         chunker = self._create_chunker_instance(chunkable_files_and_hashes=sample_chunkable_files)
+        chunker.local_repo.get_chunkable_files_and_commit_hashes = AsyncMock()
         
         # Test the interface
         file_path_commit_hash_map = chunker.chunkable_files_and_hashes
@@ -783,7 +681,6 @@ class TestVectorDBChunker:
         # Should result in empty list since range(0, 0, 200) produces no iterations
         assert batched_files_to_store == []
 
-    @pytest.mark.asyncio
     async def test_multiple_chunks_embedding_interface(self):
         """Test adding embeddings to multiple chunks with different content."""
         chunker = self._create_chunker_instance()
@@ -797,7 +694,7 @@ class TestVectorDBChunker:
         
         # Mock embedding manager to return different embeddings
         embeddings = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
-        chunker.embedding_manager.embed_text_array = AsyncMock(return_value=(embeddings, 30))
+        chunker.embedding_manager.embed_text_array.return_value = (embeddings, 30)
         
         # Test the interface
         texts_to_embed = [
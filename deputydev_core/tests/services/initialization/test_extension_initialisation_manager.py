@@ -17,20 +17,65 @@ from deputydev_core.services.initialization.extension_initialisation_manager imp
 )
 
 
+# Placeholders for dependencies the code under test only passes along; spec=[] keeps attribute access strict
+_SENTINEL_REPO = Mock(spec=[])
+_SENTINEL_WEAVIATE_CLIENT = Mock(spec=[])
+_SENTINEL_EMBEDDING_MANAGER = Mock(spec=[])
+_SENTINEL_PROCESS_EXECUTOR = Mock(spec=[])
+
+
+@pytest.fixture(scope="module")
+def mock_dependencies():
+    """Set up mock dependencies for ExtensionInitialisationManager once for the whole module."""
+    mocks = {
+        "OneDevExtensionChunker": Mock(),
+        "WeaviateSchemaDetailsService": Mock(),
+        "AppLogger": Mock(),
+    }
+    patcher = patch.multiple(
+        "deputydev_core.services.initialization.extension_initialisation_manager",
+        WEAVIATE_SCHEMA_VERSION="v1.0.0",
+        **mocks,
+    )
+    patcher.start()
+    yield mocks
+    patcher.stop()
+
+
+@pytest.fixture(scope="module")
+def manager(mock_dependencies):
+    """Create one ExtensionInitialisationManager for the module; reset_manager clears its state per test."""
+    with patch(
+        "deputydev_core.services.initialization.extension_initialisation_manager.ExtensionEmbeddingManager"
+    ) as mock_embedding_manager:
+        mock_embedding_manager.return_value = Mock()
+        return ExtensionInitialisationManager(
+            repo_path="/test/repo/path",
+            auth_token_key="test_auth_token",
+            process_executor=Mock(),
+            one_dev_client=Mock(),
+            weaviate_client=Mock(),
+            ripgrep_path="/usr/bin/rg",
+        )
+
+
 class TestExtensionInitialisationManager:
     """Test cases for ExtensionInitialisationManager class."""
 
-    @pytest.fixture
-    def mock_dependencies(self):
-        """Set up mock dependencies for ExtensionInitialisationManager."""
-        with patch.multiple(
-            "deputydev_core.services.initialization.extension_initialisation_manager",
-            OneDevExtensionChunker=Mock(),
-            WeaviateSchemaDetailsService=Mock(),
-            AppLogger=Mock(),
-            WEAVIATE_SCHEMA_VERSION="v1.0.0",
-        ):
-            yield
+    @pytest.fixture(autouse=True)
+    def reset_mock_dependencies(self, mock_dependencies):
+        """Clear call history on the shared dependency mocks between tests."""
+        for mock in mock_dependencies.values():
+            mock.reset_mock()
+
+    @pytest.fixture(autouse=True)
+    def reset_manager(self, manager):
+        """Restore the shared manager's mutable state before each test."""
+        manager.local_repo = None
+        manager.weaviate_client = None
+        manager.weaviate_process = None
+        manager.embedding_manager = Mock()
+        vars(manager).pop("process_chunks_cleanup", None)
 
     @pytest.fixture
     def manager_kwargs(self, mock_weaviate_clients, mock_process_executor, mock_one_dev_client):
@@ -45,13 +90,13 @@ class TestExtensionInitialisationManager:
         }
 
     @pytest.fixture
-    def manager(self, manager_kwargs, mock_dependencies):
-        """Create ExtensionInitialisationManager instance for testing."""
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.ExtensionEmbeddingManager"
-        ) as mock_embedding_manager:
-            mock_embedding_manager.return_value = Mock()
-            return ExtensionInitialisationManager(**manager_kwargs)
+    def patched_chunker(self, mock_dependencies):
+        """Return the module-patched OneDevExtensionChunker class and the instance it builds."""
+        mock_chunker_class = mock_dependencies["OneDevExtensionChunker"]
+        mock_chunker_instance = Mock()
+        mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=[])
+        mock_chunker_class.return_value = mock_chunker_instance
+        return mock_chunker_class, mock_chunker_instance
 
     @pytest.mark.unit
     def test_collections_defined(self):
@@ -120,116 +165,103 @@ class TestExtensionInitialisationManager:
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_prefill_vector_store_success(self, manager, sample_chunkable_files, mock_dependencies):
+    async def test_prefill_vector_store_success(self, manager, sample_chunkable_files, patched_chunker):
         """Test successful prefill_vector_store execution."""
         # Setup
-        manager.local_repo = Mock()
-        manager.weaviate_client = Mock()
-        manager.embedding_manager = Mock()
-        manager.process_executor = Mock()
+        mock_chunker_class, mock_chunker_instance = patched_chunker
+        manager.local_repo = _SENTINEL_REPO
+        manager.weaviate_client = _SENTINEL_WEAVIATE_CLIENT
+        manager.embedding_manager = _SENTINEL_EMBEDDING_MANAGER
+        manager.process_executor = _SENTINEL_PROCESS_EXECUTOR
         
         mock_chunks = [Mock(), Mock()]
+        mock_chunker_instance.create_chunks_and_docs.return_value = mock_chunks
+        manager.process_chunks_cleanup = Mock()
         
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-        ) as mock_chunker_class:
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=mock_chunks)
-            mock_chunker_class.return_value = mock_chunker_instance
-            
-            manager.process_chunks_cleanup = Mock()
-            
-            # Execute
-            await manager.prefill_vector_store(
-                chunkable_files_and_hashes=sample_chunkable_files,
-                enable_refresh=True
-            )
-            
-            # Assert
-            mock_chunker_class.assert_called_once_with(
-                local_repo=manager.local_repo,
-                weaviate_client=manager.weaviate_client,
-                embedding_manager=manager.embedding_manager,
-                process_executor=manager.process_executor,
-                indexing_progress_bar=None,
-                embedding_progress_bar=None,
-                chunkable_files_and_hashes=sample_chunkable_files,
-                file_indexing_progress_monitor=None,
-            )
-            mock_chunker_instance.create_chunks_and_docs.assert_called_once_with(enable_refresh=True)
-            manager.process_chunks_cleanup.assert_called_once_with(mock_chunks)
+        # Execute
+        await manager.prefill_vector_store(
+            chunkable_files_and_hashes=sample_chunkable_files,
+            enable_refresh=True
+        )
+        
+        # Assert
+        mock_chunker_class.assert_called_once_with(
+            local_repo=manager.local_repo,
+            weaviate_client=manager.weaviate_client,
+            embedding_manager=manager.embedding_manager,
+            process_executor=manager.process_executor,
+            indexing_progress_bar=None,
+            embedding_progress_bar=None,
+            chunkable_files_and_hashes=sample_chunkable_files,
+            file_indexing_progress_monitor=None,
+            fetch_with_vector=False,
+        )
+        mock_chunker_instance.create_chunks_and_docs.assert_called_once_with(
+            sample_chunkable_files, enable_refresh=True
+        )
+        manager.process_chunks_cleanup.assert_called_once_with(mock_chunks)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_prefill_vector_store_without_refresh(self, manager, sample_chunkable_files, mock_dependencies):
+    async def test_prefill_vector_store_without_refresh(self, manager, sample_chunkable_files, patched_chunker):
         """Test prefill_vector_store without refresh enabled."""
         # Setup
-        manager.local_repo = Mock()
-        manager.weaviate_client = Mock()
-        manager.embedding_manager = Mock()
-        manager.process_executor = Mock()
+        _mock_chunker_class, mock_chunker_instance = patched_chunker
+        manager.local_repo = _SENTINEL_REPO
+        manager.weaviate_client = _SENTINEL_WEAVIATE_CLIENT
+        manager.embedding_manager = _SENTINEL_EMBEDDING_MANAGER
+        manager.process_executor = _SENTINEL_PROCESS_EXECUTOR
         
-        mock_chunks = [Mock(), Mock()]
+        mock_chunker_instance.create_chunks_and_docs.return_value = [Mock(), Mock()]
+        manager.process_chunks_cleanup = Mock()
         
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-        ) as mock_chunker_class:
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=mock_chunks)
-            mock_chunker_class.return_value = mock_chunker_instance
-            
-            manager.process_chunks_cleanup = Mock()
-            
-            # Execute
-            await manager.prefill_vector_store(
-                chunkable_files_and_hashes=sample_chunkable_files,
-                enable_refresh=False
-            )
-            
-            # Assert
-            mock_chunker_instance.create_chunks_and_docs.assert_called_once_with(enable_refresh=False)
-            manager.process_chunks_cleanup.assert_not_called()
+        # Execute
+        await manager.prefill_vector_store(
+            chunkable_files_and_hashes=sample_chunkable_files,
+            enable_refresh=False
+        )
+        
+        # Assert
+        mock_chunker_instance.create_chunks_and_docs.assert_called_once_with(
+            sample_chunkable_files, enable_refresh=False
+        )
+        manager.process_chunks_cleanup.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_prefill_vector_store_with_progress_bars(self, manager, sample_chunkable_files, mock_dependencies):
+    async def test_prefill_vector_store_with_progress_bars(self, manager, sample_chunkable_files, patched_chunker):
         """Test prefill_vector_store with progress bars and monitors."""
         # Setup
-        manager.local_repo = Mock()
-        manager.weaviate_client = Mock()
-        manager.embedding_manager = Mock()
-        manager.process_executor = Mock()
+        mock_chunker_class, _mock_chunker_instance = patched_chunker
+        manager.local_repo = _SENTINEL_REPO
+        manager.weaviate_client = _SENTINEL_WEAVIATE_CLIENT
+        manager.embedding_manager = _SENTINEL_EMBEDDING_MANAGER
+        manager.process_executor = _SENTINEL_PROCESS_EXECUTOR
         
         mock_indexing_bar = Mock()
         mock_embedding_bar = Mock()
         mock_monitor = Mock()
         
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-        ) as mock_chunker_class:
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=[])
-            mock_chunker_class.return_value = mock_chunker_instance
-            
-            # Execute
-            await manager.prefill_vector_store(
-                chunkable_files_and_hashes=sample_chunkable_files,
-                indexing_progressbar=mock_indexing_bar,
-                embedding_progressbar=mock_embedding_bar,
-                file_indexing_progress_monitor=mock_monitor
-            )
-            
-            # Assert
-            mock_chunker_class.assert_called_once_with(
-                local_repo=manager.local_repo,
-                weaviate_client=manager.weaviate_client,
-                embedding_manager=manager.embedding_manager,
-                process_executor=manager.process_executor,
-                indexing_progress_bar=mock_indexing_bar,
-                embedding_progress_bar=mock_embedding_bar,
-                chunkable_files_and_hashes=sample_chunkable_files,
-                file_indexing_progress_monitor=mock_monitor,
-            )
+        # Execute
+        await manager.prefill_vector_store(
+            chunkable_files_and_hashes=sample_chunkable_files,
+            indexing_progressbar=mock_indexing_bar,
+            embedding_progressbar=mock_embedding_bar,
+            file_indexing_progress_monitor=mock_monitor
+        )
+        
+        # Assert
+        mock_chunker_class.assert_called_once_with(
+            local_repo=manager.local_repo,
+            weaviate_client=manager.weaviate_client,
+            embedding_manager=manager.embedding_manager,
+            process_executor=manager.process_executor,
+            indexing_progress_bar=mock_indexing_bar,
+            embedding_progress_bar=mock_embedding_bar,
+            chunkable_files_and_hashes=sample_chunkable_files,
+            file_indexing_progress_monitor=mock_monitor,
+            fetch_with_vector=False,
+        )
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -244,7 +276,7 @@ class TestExtensionInitialisationManager:
     @pytest.mark.asyncio
     async def test_prefill_vector_store_weaviate_client_not_initialized(self, manager, sample_chunkable_files, mock_dependencies):
         """Test prefill_vector_store raises assertion when weaviate_client is not initialized."""
-        manager.local_repo = Mock()
+        manager.local_repo = _SENTINEL_REPO
         manager.weaviate_client = None
         
         with pytest.raises(AssertionError, match="Connect to vector store"):
@@ -252,13 +284,14 @@ class TestExtensionInitialisationManager:
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_sync_schema_and_return_cleanup_status_new_schema(self, manager, mock_dependencies):
-        """Test _sync_schema_and_return_cleanup_status with new schema."""
+    @pytest.mark.parametrize("should_clean", [True, False], ids=["new_schema", "existing_schema"])
+    async def test_sync_schema_and_return_cleanup_status(self, manager, mock_dependencies, should_clean):
+        """Test _sync_schema_and_return_cleanup_status for both new and existing schemas."""
         # Setup
         manager.weaviate_client = Mock()
         manager.weaviate_client.sync_client.collections.delete_all = Mock()
         
-        with patch.object(manager, "_should_recreate_schema", return_value=True) as mock_should_recreate, \
+        with patch.object(manager, "_should_recreate_schema", return_value=should_clean) as mock_should_recreate, \
              patch.object(manager, "_populate_collections") as mock_populate, \
              patch(
                 "deputydev_core.services.initialization.extension_initialisation_manager.WeaviateSchemaDetailsService"
@@ -272,135 +305,66 @@ class TestExtensionInitialisationManager:
             mock_service_class.return_value = mock_service_instance
             
             # Execute
-            result = await manager._sync_schema_and_return_cleanup_status(should_clean=True)
+            result = await manager._sync_schema_and_return_cleanup_status(should_clean=should_clean)
             
             # Assert
-            assert result is True
-            mock_should_recreate.assert_called_once_with(True)
-            mock_logger.log_debug.assert_called_once_with("Cleaning up the vector store")
-            manager.weaviate_client.sync_client.collections.delete_all.assert_called_once()
+            assert result is should_clean
+            mock_should_recreate.assert_called_once_with(should_clean)
             mock_populate.assert_called_once()
-            mock_service_instance.set_schema_version.assert_called_once()
+            if should_clean:
+                mock_logger.log_debug.assert_called_once_with("Cleaning up the vector store")
+                manager.weaviate_client.sync_client.collections.delete_all.assert_called_once()
+                mock_service_instance.set_schema_version.assert_called_once()
+            else:
+                mock_logger.log_debug.assert_not_called()
+                manager.weaviate_client.sync_client.collections.delete_all.assert_not_called()
+                mock_service_instance.set_schema_version.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_sync_schema_and_return_cleanup_status_existing_schema(self, manager, mock_dependencies):
-        """Test _sync_schema_and_return_cleanup_status with existing schema."""
-        # Setup
-        manager.weaviate_client = Mock()
-        manager.weaviate_client.sync_client.collections.delete_all = Mock()
-        
-        with patch.object(manager, "_should_recreate_schema", return_value=False) as mock_should_recreate, \
-             patch.object(manager, "_populate_collections") as mock_populate, \
-             patch(
-                "deputydev_core.services.initialization.extension_initialisation_manager.WeaviateSchemaDetailsService"
-            ) as mock_service_class, \
-             patch(
-                "deputydev_core.services.initialization.extension_initialisation_manager.AppLogger"
-            ) as mock_logger:
-            
-            mock_service_instance = Mock()
-            mock_service_instance.set_schema_version = AsyncMock()
-            mock_service_class.return_value = mock_service_instance
-            
-            # Execute
-            result = await manager._sync_schema_and_return_cleanup_status(should_clean=False)
-            
-            # Assert
-            assert result is False
-            mock_should_recreate.assert_called_once_with(False)
-            mock_logger.log_debug.assert_not_called()
-            manager.weaviate_client.sync_client.collections.delete_all.assert_not_called()
-            mock_populate.assert_called_once()
-            mock_service_instance.set_schema_version.assert_not_called()
-
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_initialize_vector_db_with_clean(self, manager, mock_dependencies):
-        """Test initialize_vector_db with clean flag."""
-        # Setup
-        mock_weaviate_client = Mock()
-        mock_process = Mock()
-        manager.weaviate_client = mock_weaviate_client
-        manager.weaviate_process = mock_process
-        
-        with patch.object(manager, "_sync_schema_and_return_cleanup_status", return_value=True) as mock_sync:
-            with patch("deputydev_core.services.initialization.initialization_service.InitializationManager.initialize_vector_db") as mock_super:
-                mock_super.return_value = None
-                
-                # Execute
-                result = await manager.initialize_vector_db(should_clean=True)
-                
-                # Assert
-                assert result == (mock_weaviate_client, mock_process, True)
-                mock_super.assert_called_once()
-                mock_sync.assert_called_once_with(should_clean=True)
-
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_initialize_vector_db_without_clean(self, manager, mock_dependencies):
-        """Test initialize_vector_db without clean flag."""
+    @pytest.mark.parametrize(
+        "should_clean,expected",
+        [(True, True), (False, False), (None, False)],
+        ids=["with_clean", "without_clean", "default_parameters"],
+    )
+    async def test_initialize_vector_db(self, manager, mock_dependencies, should_clean, expected):
+        """Test initialize_vector_db with an explicit clean flag and with the default."""
         # Setup
         mock_weaviate_client = Mock()
         mock_process = Mock()
         manager.weaviate_client = mock_weaviate_client
         manager.weaviate_process = mock_process
         
-        with patch.object(manager, "_sync_schema_and_return_cleanup_status", return_value=False) as mock_sync:
+        with patch.object(manager, "_sync_schema_and_return_cleanup_status", return_value=expected) as mock_sync:
             with patch("deputydev_core.services.initialization.initialization_service.InitializationManager.initialize_vector_db") as mock_super:
                 mock_super.return_value = None
                 
                 # Execute
-                result = await manager.initialize_vector_db(should_clean=False)
+                result = await manager.initialize_vector_db(
+                    **({"should_clean": should_clean} if should_clean is not None else {})
+                )
                 
                 # Assert
-                assert result == (mock_weaviate_client, mock_process, False)
+                assert result == (mock_weaviate_client, mock_process, expected)
                 mock_super.assert_called_once()
-                mock_sync.assert_called_once_with(should_clean=False)
+                mock_sync.assert_called_once_with(should_clean=expected)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_initialize_vector_db_default_parameters(self, manager, mock_dependencies):
-        """Test initialize_vector_db with default parameters."""
-        # Setup
-        mock_weaviate_client = Mock()
-        mock_process = Mock()
-        manager.weaviate_client = mock_weaviate_client
-        manager.weaviate_process = mock_process
-        
-        with patch.object(manager, "_sync_schema_and_return_cleanup_status", return_value=False) as mock_sync:
-            with patch("deputydev_core.services.initialization.initialization_service.InitializationManager.initialize_vector_db") as mock_super:
-                mock_super.return_value = None
-                
-                # Execute
-                result = await manager.initialize_vector_db()
-                
-                # Assert
-                assert result == (mock_weaviate_client, mock_process, False)
-                mock_sync.assert_called_once_with(should_clean=False)
-
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_prefill_vector_store_chunker_exception(self, manager, sample_chunkable_files, mock_dependencies):
+    async def test_prefill_vector_store_chunker_exception(self, manager, sample_chunkable_files, patched_chunker):
         """Test prefill_vector_store handles chunker exceptions properly."""
         # Setup
-        manager.local_repo = Mock()
-        manager.weaviate_client = Mock()
-        manager.embedding_manager = Mock()
-        manager.process_executor = Mock()
+        _mock_chunker_class, mock_chunker_instance = patched_chunker
+        manager.local_repo = _SENTINEL_REPO
+        manager.weaviate_client = _SENTINEL_WEAVIATE_CLIENT
+        manager.embedding_manager = _SENTINEL_EMBEDDING_MANAGER
+        manager.process_executor = _SENTINEL_PROCESS_EXECUTOR
         
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-        ) as mock_chunker_class:
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.create_chunks_and_docs = AsyncMock(
-                side_effect=Exception("Chunker failed")
-            )
-            mock_chunker_class.return_value = mock_chunker_instance
-            
-            # Execute & Assert
-            with pytest.raises(Exception, match="Chunker failed"):
-                await manager.prefill_vector_store(sample_chunkable_files)
+        mock_chunker_instance.create_chunks_and_docs.side_effect = Exception("Chunker failed")
+        
+        # Execute & Assert
+        with pytest.raises(Exception, match="Chunker failed"):
+            await manager.prefill_vector_store(sample_chunkable_files)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -416,7 +380,7 @@ class TestExtensionInitialisationManager:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_full_initialization_workflow(self, manager_kwargs, mock_dependencies):
+    async def test_full_initialization_workflow(self, manager_kwargs, patched_chunker):
         """Integration test for the complete initialization workflow."""
         with patch(
             "deputydev_core.services.initialization.extension_initialisation_manager.ExtensionEmbeddingManager"
@@ -431,16 +395,12 @@ class TestExtensionInitialisationManager:
             manager.local_repo = Mock()
             manager.embedding_manager = Mock()
             
+            _mock_chunker_class, mock_chunker_instance = patched_chunker
             with patch.object(manager, "_sync_schema_and_return_cleanup_status", return_value=True) as mock_sync, \
-                 patch("deputydev_core.services.initialization.initialization_service.InitializationManager.initialize_vector_db") as mock_super_init, \
-                 patch(
-                    "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-                 ) as mock_chunker_class:
+                 patch("deputydev_core.services.initialization.initialization_service.InitializationManager.initialize_vector_db") as mock_super_init:
                 
                 mock_super_init.return_value = None
-                mock_chunker_instance = Mock()
-                mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=[Mock()])
-                mock_chunker_class.return_value = mock_chunker_instance
+                mock_chunker_instance.create_chunks_and_docs.return_value = [Mock()]
                 manager.process_chunks_cleanup = Mock()
                 
                 # Execute full workflow
@@ -474,30 +434,24 @@ class TestExtensionInitialisationManager:
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_prefill_vector_store_empty_files(self, manager, mock_dependencies):
+    async def test_prefill_vector_store_empty_files(self, manager, patched_chunker):
         """Test prefill_vector_store with empty chunkable files."""
         # Setup
-        manager.local_repo = Mock()
-        manager.weaviate_client = Mock()
-        manager.embedding_manager = Mock()
-        manager.process_executor = Mock()
+        mock_chunker_class, mock_chunker_instance = patched_chunker
+        manager.local_repo = _SENTINEL_REPO
+        manager.weaviate_client = _SENTINEL_WEAVIATE_CLIENT
+        manager.embedding_manager = _SENTINEL_EMBEDDING_MANAGER
+        manager.process_executor = _SENTINEL_PROCESS_EXECUTOR
         
-        with patch(
-            "deputydev_core.services.initialization.extension_initialisation_manager.OneDevExtensionChunker"
-        ) as mock_chunker_class:
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.create_chunks_and_docs = AsyncMock(return_value=[])
-            mock_chunker_class.return_value = mock_chunker_instance
-            
-            # Execute
-            await manager.prefill_vector_store(
-                chunkable_files_and_hashes={},
-                enable_refresh=False
-            )
-            
-            # Assert
-            mock_chunker_class.assert_called_once()
-            mock_chunker_instance.create_chunks_and_docs.assert_called_once_with(enable_refresh=False)
+        # Execute
+        await manager.prefill_vector_store(
+            chunkable_files_and_hashes={},
+            enable_refresh=False
+        )
+        
+        # Assert
+        mock_chunker_class.assert_called_once()
+        mock_chunker_instance.create_chunks_and_docs.assert_called_once_with({}, enable_refresh=False)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
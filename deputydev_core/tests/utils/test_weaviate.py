@@ -0,0 +1,73 @@
+"""
+Unit tests for the Weaviate utility helpers.
+
+This module covers clean_weaviate_collections, which deletes every collection concurrently through the async client.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from deputydev_core.utils import weaviate as weaviate_utils
+from deputydev_core.utils.weaviate import clean_weaviate_collections
+
+
+@pytest.fixture
+def weaviate_clients():
+    """Sync/async client pair whose async collections API is mocked."""
+    clients = Mock()
+    clients.async_client.collections.list_all = AsyncMock(
+        return_value={"Chunks": Mock(), "ChunkFiles": Mock(), "WeaviateSchemaDetails": Mock()}
+    )
+    clients.async_client.collections.delete = AsyncMock()
+    return clients
+
+
+@pytest.fixture
+def patched_get_client(weaviate_clients):
+    with patch.object(weaviate_utils, "get_weaviate_client", AsyncMock(return_value=weaviate_clients)) as mock_get:
+        yield mock_get
+
+
+class TestCleanWeaviateCollections:
+    """Test cases for clean_weaviate_collections."""
+
+    async def test_deletes_every_listed_collection(self, weaviate_clients, patched_get_client):
+        initialization_manager = Mock()
+
+        await clean_weaviate_collections(initialization_manager)
+
+        patched_get_client.assert_awaited_once_with(initialization_manager)
+        weaviate_clients.async_client.collections.list_all.assert_awaited_once_with(simple=True)
+        deleted = {call.args[0] for call in weaviate_clients.async_client.collections.delete.await_args_list}
+        assert deleted == {"Chunks", "ChunkFiles", "WeaviateSchemaDetails"}
+        assert weaviate_clients.async_client.collections.delete.await_count == 3
+        weaviate_clients.sync_client.collections.delete_all.assert_not_called()
+
+    async def test_no_collections_deletes_nothing(self, weaviate_clients, patched_get_client):
+        weaviate_clients.async_client.collections.list_all.return_value = {}
+
+        await clean_weaviate_collections(Mock())
+
+        weaviate_clients.async_client.collections.delete.assert_not_awaited()
+
+    async def test_caps_concurrent_deletes(self, weaviate_clients, patched_get_client):
+        names = [f"Collection{i}" for i in range(weaviate_utils._MAX_CONCURRENT_DELETES * 3)]
+        weaviate_clients.async_client.collections.list_all.return_value = dict.fromkeys(names)
+        in_flight = 0
+        peak = 0
+
+        async def slow_delete(name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        weaviate_clients.async_client.collections.delete.side_effect = slow_delete
+
+        await clean_weaviate_collections(Mock())
+
+        assert weaviate_clients.async_client.collections.delete.await_count == len(names)
+        assert peak == weaviate_utils._MAX_CONCURRENT_DELETES
@@ -1,121 +1,315 @@
+import atexit
+import io
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from importlib.util import find_spec
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-from deputydev_core.utils.context_vars import get_context_value, set_context_values
-
-# --- UTF-8 logging patch ---
-# Ensures stdout uses UTF-8 so emojis and Unicode don't break logging
-try:
-    sys.stdout.reconfigure(encoding="utf-8")
-except Exception:  # noqa: BLE001
-    pass
+from deputydev_core.utils.context_vars import (
+    get_context_value,
+    get_context_values,
+    has_meta_context,
+    set_context_values,
+)
 
 # Root logger as a safe default
 _root_logger = logging.getLogger()
 
+# Set once set_logger_config has applied the UTF-8 stdout patch
+_configured = False
 
-class AppLogger:
-    # ---------- Context ----------
-    @classmethod
-    def set_logger_context(cls, context: Dict[str, Any]) -> None:
-        set_context_values(app_logger_context=context)
+# Background listener draining root records when set_logger_config(async_logging=True) is used
+_queue_listener: Optional[QueueListener] = None
 
-    # ---------- Framework detection (lazy) ----------
-    @classmethod
-    def __is_called_from_sanic(cls) -> bool:
-        """Return True if a Sanic app is present (no import unless needed)."""
-        try:
-            from sanic import Sanic  # lazy import
 
-            app = Sanic.get_app()
-            return True if app else False
+# Handler installed by set_logger_config(buffered=True); AppLogger.flush() pushes its buffer out
+_buffered_handler: Optional[logging.StreamHandler] = None
+
+_LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that only flushes for records at or above flush_level, leaving the rest in the buffer."""
+
+    def __init__(self, stream: Any, flush_level: int = logging.WARNING) -> None:
+        super().__init__(stream)
+        self.flush_level = flush_level
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
         except Exception:  # noqa: BLE001
-            return False
+            self.handleError(record)
 
-    @classmethod
-    def __is_called_from_fastapi(cls) -> bool:
-        """Best-effort check for FastAPI/Uvicorn runtime without hard dependency."""
+
+def _make_buffered_handler(stream: Any) -> Optional[logging.StreamHandler]:
+    """Wrap the stream's file descriptor in a 64 KB buffer; None if the stream is not backed by a descriptor."""
+    try:
+        fileno = (stream if stream is not None else sys.stderr).fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    # closefd=False so closing the buffered writer never closes stdout/stderr underneath
+    buffered_stream = io.open(fileno, "w", buffering=_LOG_BUFFER_SIZE, encoding="utf-8", closefd=False)
+    return _BufferedStreamHandler(buffered_stream)
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# Logger context followed by the request meta keys merged into it, fetched with one context read per log call
+_LOGGER_CONTEXT_KEYS = ("app_logger_context", "team_id", "scm_pr_id", "repo_name", "request_id")
+
+
+# The logging helpers below are plain module functions sharing module-level state, so a log call does not pay
+# for classmethod binding on every hop; AppLogger exposes them as a facade.
+
+# Framework logger resolved on the first log call; the runtime framework does not change afterwards
+_cached_logger: Optional[logging.Logger] = None
+# Level methods of the cached logger, bound once alongside it
+_info: Optional[Callable[..., None]] = None
+_debug: Optional[Callable[..., None]] = None
+_warning: Optional[Callable[..., None]] = None
+_exception: Optional[Callable[..., None]] = None
+
+_MESSAGE_FORMAT = "%s -- message -- %s"
+
+
+def _is_module_available(name: str) -> bool:
+    try:
+        return find_spec(name) is not None
+    except ValueError:
+        # Already imported without a spec (e.g. a stub placed in sys.modules); it is importable as-is
+        return name in sys.modules
+
+
+# Probed once at import: without Sanic/FastAPI installed, framework detection skips the import attempt entirely
+_HAS_SANIC = _is_module_available("sanic")
+_HAS_FASTAPI = _is_module_available("fastapi")
+# Level numbers bound once so the isEnabledFor checks skip the attribute lookup on the logging module
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+
+
+# ---------- Framework detection (lazy) ----------
+def _is_called_from_sanic() -> bool:
+    """Return True if a Sanic app is present (no import unless needed)."""
+    if not _HAS_SANIC:
+        return False
+    try:
+        from sanic import Sanic  # lazy import
+
+        app = Sanic.get_app()
+        return True if app else False
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _is_called_from_fastapi() -> bool:
+    """Best-effort check for FastAPI/Uvicorn runtime without hard dependency."""
+    if not _HAS_FASTAPI:
+        return False
+    if "uvicorn" in sys.modules or "gunicorn" in sys.modules:
+        return True
+    try:
+        from fastapi.logger import logger as fastapi_logger  # lazy import
+
+        return bool(fastapi_logger.handlers)
+    except Exception:  # noqa: BLE001
+        return False
+
+
+# ---------- Logger selection ----------
+def _resolve_logger() -> logging.Logger:
+    """Choose a framework-aware logger lazily, else return root logger."""
+    if _is_called_from_sanic():
         try:
-            import fastapi  # noqa: F401
+            from sanic.log import logger as sanic_logger  # lazy import
 
-            if "uvicorn" in sys.modules or "gunicorn" in sys.modules:
-                return True
+            return sanic_logger
+        except Exception:  # noqa: BLE001
+            return _root_logger
 
+    if _is_called_from_fastapi():
+        try:
             from fastapi.logger import logger as fastapi_logger  # lazy import
 
-            return bool(fastapi_logger.handlers)
+            return fastapi_logger
         except Exception:  # noqa: BLE001
-            return False
+            return logging.getLogger("uvicorn.error")
 
-    # ---------- Logger selection ----------
-    @classmethod
-    def __get_selected_logger(cls) -> logging.Logger:
-        """Choose a framework-aware logger lazily, else return root logger."""
-        if cls.__is_called_from_sanic():
-            try:
-                from sanic.log import logger as sanic_logger  # lazy import
+    return _root_logger
 
-                return sanic_logger
-            except Exception:  # noqa: BLE001
-                return _root_logger
 
-        if cls.__is_called_from_fastapi():
-            try:
-                from fastapi.logger import logger as fastapi_logger  # lazy import
+def _get_selected_logger() -> logging.Logger:
+    """Return the framework-aware logger, resolving it until the choice is final and then caching it."""
+    global _cached_logger, _info, _debug, _warning, _exception
+    if _cached_logger is not None:
+        return _cached_logger
+    logger = _resolve_logger()
+    _info, _debug, _warning, _exception = logger.info, logger.debug, logger.warning, logger.exception
+    # The root-logger fallback is only final when no framework is installed; otherwise the app may simply not be
+    # registered yet (e.g. logging at import time), so keep resolving until a framework logger is found
+    if logger is not _root_logger or not (_HAS_SANIC or _HAS_FASTAPI):
+        _cached_logger = logger
+    return logger
 
-                return fastapi_logger
-            except Exception:  # noqa: BLE001
-                return logging.getLogger("uvicorn.error")
 
-        return _root_logger
+def _reset_logger_cache() -> None:
+    """Forget the cached logger so the next log call re-runs framework detection."""
+    global _cached_logger, _info, _debug, _warning, _exception
+    _cached_logger = _info = _debug = _warning = _exception = None
 
-    # ---------- Context enrichment ----------
-    @classmethod
-    def __get_meta_info(cls) -> Dict[str, Any]:
-        return {
-            "team_id": get_context_value("team_id"),
-            "scm_pr_id": get_context_value("scm_pr_id"),
-            "repo_name": get_context_value("repo_name"),
-            "request_id": get_context_value("request_id"),
-        }
 
-    @classmethod
-    def __get_logger_context(cls) -> Dict[str, Any]:
-        data: Dict[str, Any] = get_context_value("app_logger_context") or {}
-        meta_info = cls.__get_meta_info()
-        if any(meta_info.values()):
-            data.update(meta_info)
+# ---------- Context enrichment ----------
+# The context accessors are bound as default arguments so each log call reads locals instead of globals
+def _get_logger_context(
+    _has_meta: Callable[[], bool] = has_meta_context.get,
+    _get: Callable[[str], Any] = get_context_value,
+    _get_values: Callable[..., Tuple[Any, ...]] = get_context_values,
+) -> Dict[str, Any]:
+    if not _has_meta():
+        return _get("app_logger_context") or {}
+    data, team_id, scm_pr_id, repo_name, request_id = _get_values(*_LOGGER_CONTEXT_KEYS)
+    data = data or {}
+    if not (team_id or scm_pr_id or repo_name or request_id):
         return data
+    # Build a new dict rather than updating the one stored in the context var
+    return {**data, "team_id": team_id, "scm_pr_id": scm_pr_id, "repo_name": repo_name, "request_id": request_id}
 
-    @classmethod
-    def build_message(cls, message: str) -> str:
-        return f"{cls.__get_logger_context()} -- message -- {message}"
 
-    # ---------- Public logging helpers ----------
-    @classmethod
-    def log_info(cls, message: str) -> None:
-        cls.__get_selected_logger().info(cls.build_message(message))
+# Shared read-only extra for records logged without context, so every record still carries a ctx attribute
+_NO_CONTEXT_EXTRA: Mapping[str, Any] = MappingProxyType({"ctx": MappingProxyType({})})
+
+
+def _emit(log: Callable[..., None], message: str) -> None:
+    """
+    Log message through a bound level method, prefixing the context when there is one.
+
+    The context dict is also attached to the record as record.ctx (via extra), so structured handlers can read
+    it without parsing the message.
+    """
+    context = _get_logger_context()
+    if not context:
+        log(message, extra=_NO_CONTEXT_EXTRA)
+    else:
+        log(_MESSAGE_FORMAT, context, message, extra={"ctx": context})
+
+
+# ---------- Logging helpers ----------
+# Level checks run before the context lookup, and the final string is only formatted by the logging
+# framework (via %-style args) for records a handler actually emits. Once resolved, the cached logger is read
+# directly and _get_selected_logger is only called on the first log line.
+def _log_info(message: str) -> None:
+    if (_cached_logger or _get_selected_logger()).isEnabledFor(_INFO):
+        _emit(_info, message)
+
+
+def _log_error(message: str) -> None:
+    if (_cached_logger or _get_selected_logger()).isEnabledFor(_ERROR):
+        _emit(_exception, message)
 
+
+def _log_warn(message: str) -> None:
+    if (_cached_logger or _get_selected_logger()).isEnabledFor(_WARNING):
+        _emit(_warning, message)
+
+
+def _log_debug(message: str) -> None:
+    if (_cached_logger or _get_selected_logger()).isEnabledFor(_DEBUG):
+        _emit(_debug, message)
+
+
+class AppLogger:
+    # ---------- Context ----------
     @classmethod
-    def log_error(cls, message: str) -> None:
-        cls.__get_selected_logger().exception(cls.build_message(message))
+    def set_logger_context(cls, context: Dict[str, Any]) -> None:
+        set_context_values(app_logger_context=context)
+
+    reset_logger_cache = staticmethod(_reset_logger_cache)
 
     @classmethod
-    def log_warn(cls, message: str) -> None:
-        cls.__get_selected_logger().warning(cls.build_message(message))
+    def build_message(cls, message: str) -> str:
+        """Return the formatted log line eagerly; the log_* helpers defer this to the logging framework."""
+        context = _get_logger_context()
+        if not context:
+            return message
+        return f"{context} -- message -- {message}"
+
+    # ---------- Public logging helpers ----------
+    log_info = staticmethod(_log_info)
+    log_error = staticmethod(_log_error)
+    log_warn = staticmethod(_log_warn)
+    log_debug = staticmethod(_log_debug)
 
     @classmethod
-    def log_debug(cls, message: str) -> None:
-        cls.__get_selected_logger().debug(cls.build_message(message))
+    def flush(cls) -> None:
+        """Write out anything held by the root handlers, including the buffer from set_logger_config(buffered=True)."""
+        for handler in _root_logger.handlers:
+            handler.flush()
+        if _buffered_handler is not None:
+            _buffered_handler.flush()
 
     # ---------- Basic configuration ----------
     @classmethod
-    def set_logger_config(cls, debug: bool = False, stream: Any = None) -> None:
+    def set_logger_config(
+        cls, debug: bool = False, stream: Any = None, async_logging: bool = False, buffered: bool = False
+    ) -> None:
+        """
+        Configure the root logger.
+
+        With async_logging=True, root records are handed to a QueueHandler and written by a background
+        QueueListener thread, so callers never block on stream writes. The listener is stopped (and the queue
+        drained) at interpreter exit. Opt-in because records logged right before a hard crash may be lost.
+
+        With buffered=True, records are written through a 64 KB buffer that is flushed when it fills, on any
+        WARNING or higher record, on AppLogger.flush() and at shutdown. Ignored for streams without a file
+        descriptor (e.g. StringIO).
+        """
+        global _configured, _queue_listener, _buffered_handler
+        if not _configured:
+            # --- UTF-8 logging patch ---
+            # Ensures stdout uses UTF-8 so emojis and Unicode don't break logging. Done here rather than at
+            # import time so importing this module does not rewrap stdout.
+            try:
+                sys.stdout.reconfigure(encoding="utf-8")
+            except Exception:  # noqa: BLE001
+                pass
+            _configured = True
+
         config: Dict[str, Any] = {
             "level": logging.DEBUG if debug else logging.INFO,
         }
-        if stream is not None:
+        if buffered and _buffered_handler is None and not _root_logger.handlers:
+            _buffered_handler = _make_buffered_handler(stream)
+
+        if async_logging and _queue_listener is None and not _root_logger.handlers:
+            stream_handler = _buffered_handler or logging.StreamHandler(stream)
+            stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            record_queue: queue.Queue = queue.Queue(-1)
+            queue_handler = QueueHandler(record_queue)
+            # The listener's handler applies the real format; the queue handler only renders the message
+            queue_handler.setFormatter(logging.Formatter("%(message)s"))
+            _queue_listener = QueueListener(record_queue, stream_handler, respect_handler_level=True)
+            _queue_listener.start()
+            atexit.register(_stop_queue_listener)
+            config["handlers"] = [queue_handler]
+        elif _buffered_handler is not None and not _root_logger.handlers:
+            config["handlers"] = [_buffered_handler]
+        elif stream is not None:
             config["stream"] = stream
 
         # Ensure UTF-8 encoding even if Python default is ASCII
@@ -1,11 +1,22 @@
+from operator import attrgetter
 from typing import Dict, List
 
+from pydantic import TypeAdapter
+
 from deputydev_core.services.chunking.chunk_info import ChunkInfo
 
+# Serializes a whole chunk list in one pass through pydantic-core instead of one model_dump call per chunk
+_CHUNKS_ADAPTER = TypeAdapter(List[ChunkInfo])
+
+
+_get_denotation = attrgetter("denotation")
+
 
 def filter_chunks_by_denotation(chunks: List[ChunkInfo], denotations: List[str]) -> List[ChunkInfo]:
-    return [chunk for chunk in chunks if chunk.denotation in denotations]
+    # Hash lookups instead of scanning the denotation list for every chunk
+    denotation_set = denotations if isinstance(denotations, frozenset) else frozenset(denotations)
+    return [chunk for chunk in chunks if _get_denotation(chunk) in denotation_set]
 
 
 def jsonify_chunks(chunks: List[ChunkInfo]) -> List[Dict[str, dict]]:
-    return [chunk.model_dump(mode="json") for chunk in chunks]
+    return _CHUNKS_ADAPTER.dump_python(chunks, mode="json")
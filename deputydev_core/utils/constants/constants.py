@@ -1,40 +1,44 @@
+import re
 from enum import Enum
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Pattern, Tuple
 
 APP_VERSION = "1.0.4"
 LARGE_NO_OF_CHUNKS = 60
 
-ALL_EXTENSIONS = {
-    # Python
-    "py": "python",
-    # JavaScript family
-    "js": "javascript",
-    "jsx": "javascript",
-    "mjs": "javascript",
-    "cjs": "javascript",
-    # TypeScript family
-    "ts": "typescript",
-    "tsx": "tsx",
-    "mts": "typescript",
-    "cts": "typescript",
-    # Java
-    "java": "java",
-    # C/C++
-    "c": "c",
-    "h": "c",
-    "cpp": "cpp",
-    "cc": "cpp",
-    "cxx": "cpp",
-    "hpp": "cpp",
-    # Other languages
-    "go": "go",
-    "rs": "rust",
-    "rb": "ruby",
-    "html": "html",
-    "kt": "kotlin",
-    "json": "json",
-    "swift": "swift",
-}
+ALL_EXTENSIONS: Mapping[str, str] = MappingProxyType(
+    {
+        # Python
+        "py": "python",
+        # JavaScript family
+        "js": "javascript",
+        "jsx": "javascript",
+        "mjs": "javascript",
+        "cjs": "javascript",
+        # TypeScript family
+        "ts": "typescript",
+        "tsx": "tsx",
+        "mts": "typescript",
+        "cts": "typescript",
+        # Java
+        "java": "java",
+        # C/C++
+        "c": "c",
+        "h": "c",
+        "cpp": "cpp",
+        "cc": "cpp",
+        "cxx": "cpp",
+        "hpp": "cpp",
+        # Other languages
+        "go": "go",
+        "rs": "rust",
+        "rb": "ruby",
+        "html": "html",
+        "kt": "kotlin",
+        "json": "json",
+        "swift": "swift",
+    }
+)
 
 
 class PropertyTypes(Enum):
@@ -51,10 +55,18 @@ CHUNKFILE_KEYWORD_PROPERTY_MAP = {
 }
 
 
+# Member values per ExtendedEnum subclass; kept at module level since a class attribute would become an enum member
+_ENUM_VALUES_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
 class ExtendedEnum(Enum):
     @classmethod
     def list(cls) -> List[str]:
-        return list(map(lambda c: c.value, cls))
+        """Return the member values; they are computed once per enum and each call gets its own list."""
+        values = _ENUM_VALUES_CACHE.get(cls)
+        if values is None:
+            values = _ENUM_VALUES_CACHE[cls] = tuple(member.value for member in cls)
+        return list(values)
 
 
 class LLMModelNames(ExtendedEnum):
@@ -93,141 +105,160 @@ class SupportedPlatforms(Enum):
 # Constants for summarization
 
 # Special filename mappings
-SPECIAL_FILENAME_MAP: Dict[str, str] = {
-    "dockerfile": "dockerfile",
-    "makefile": "make",
-    "gnumakefile": "make",
-    "cmakelists.txt": "cmake",
-}
+SPECIAL_FILENAME_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "dockerfile": "dockerfile",
+        "makefile": "make",
+        "gnumakefile": "make",
+        "cmakelists.txt": "cmake",
+    }
+)
 
 # File type extension sets
-CODE_EXTENSIONS: Set[str] = {
-    ".py",
-    ".js",
-    ".jsx",
-    ".ts",
-    ".tsx",
-    ".java",
-    ".cpp",
-    ".c",
-    ".h",
-    ".hpp",
-    ".go",
-    ".rs",
-    ".rb",
-    ".php",
-    ".swift",
-    ".kt",
-    ".scala",
-    ".css",
-    ".html",
-    ".htm",
-    ".sql",
-    ".lua",
-    ".dart",
-    ".r",
-    ".elm",
-    ".zig",
-    ".sh",
-    ".bash",
-    ".swift",
-}
-
-TEXT_EXTENSIONS: Set[str] = {".md", ".txt", ".rst", ".tex", ".org", ".adoc", ".textile"}
-
-CONFIG_EXTENSIONS: Set[str] = {
-    ".json",
-    ".yaml",
-    ".yml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".env",
-    ".xml",
-    ".properties",
-    ".conf",
-    ".config",
-}
-
-BINARY_EXTENSIONS: Set[str] = {
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".bmp",
-    ".tiff",
-    ".webp",
-    ".svg",
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".xls",
-    ".xlsx",
-    ".ppt",
-    ".pptx",
-    ".zip",
-    ".rar",
-    ".7z",
-    ".tar",
-    ".gz",
-    ".bz2",
-    ".exe",
-    ".dll",
-    ".so",
-    ".dylib",
-    ".bin",
-    ".pyc",
-    ".pyo",
-    ".class",
-    ".jar",
-    ".war",
-    ".mp3",
-    ".mp4",
-    ".avi",
-    ".mov",
-    ".wmv",
-}
+CODE_EXTENSIONS: FrozenSet[str] = frozenset(
+    {
+        ".py",
+        ".js",
+        ".jsx",
+        ".ts",
+        ".tsx",
+        ".java",
+        ".cpp",
+        ".c",
+        ".h",
+        ".hpp",
+        ".go",
+        ".rs",
+        ".rb",
+        ".php",
+        ".swift",
+        ".kt",
+        ".scala",
+        ".css",
+        ".html",
+        ".htm",
+        ".sql",
+        ".lua",
+        ".dart",
+        ".r",
+        ".elm",
+        ".zig",
+        ".sh",
+        ".bash",
+        ".swift",
+    }
+)
+
+TEXT_EXTENSIONS: FrozenSet[str] = frozenset({".md", ".txt", ".rst", ".tex", ".org", ".adoc", ".textile"})
+
+CONFIG_EXTENSIONS: FrozenSet[str] = frozenset(
+    {
+        ".json",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".env",
+        ".xml",
+        ".properties",
+        ".conf",
+        ".config",
+    }
+)
+
+BINARY_EXTENSIONS: FrozenSet[str] = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".tiff",
+        ".webp",
+        ".svg",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".zip",
+        ".rar",
+        ".7z",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".bin",
+        ".pyc",
+        ".pyo",
+        ".class",
+        ".jar",
+        ".war",
+        ".mp3",
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".wmv",
+    }
+)
 
 # Tree-sitter node types for code structures
-IMPORTANT_NODE_TYPES: Set[str] = {
-    "class_definition",
-    "class_declaration",
-    "class",
-    "function_definition",
-    "function_declaration",
-    "function",
-    "method_definition",
-    "import_statement",
-    "import_declaration",
-    "import_from_statement",
-    "decorator",
-    "annotation",
-    "interface_declaration",
-    "enum_declaration",
-    "struct_declaration",
-    "variable_declaration",
-    "const_declaration",
-    "let_declaration",
-}
+IMPORTANT_NODE_TYPES: FrozenSet[str] = frozenset(
+    {
+        "class_definition",
+        "class_declaration",
+        "class",
+        "function_definition",
+        "function_declaration",
+        "function",
+        "method_definition",
+        "import_statement",
+        "import_declaration",
+        "import_from_statement",
+        "decorator",
+        "annotation",
+        "interface_declaration",
+        "enum_declaration",
+        "struct_declaration",
+        "variable_declaration",
+        "const_declaration",
+        "let_declaration",
+    }
+)
 
 # Code patterns for regex fallback
-CODE_PATTERNS = [
-    (r"^\s*class\s+\w+", "class"),
-    (r"^\s*def\s+\w+", "function"),
-    (r"^\s*function\s+\w+", "function"),
-    (r"^\s*(import|from)\s+", "import"),
-    (r"^\s*@\w+", "decorator"),
-    (r"^\s*(public|private|protected)\s+class\s+\w+", "class"),
-    (r"^\s*(public|private|protected)?\s*(static)?\s*\w+\s*\(", "function"),
+CODE_PATTERNS: List[Tuple[Pattern[str], str]] = [
+    (re.compile(r"^\s*class\s+\w+"), "class"),
+    (re.compile(r"^\s*def\s+\w+"), "function"),
+    (re.compile(r"^\s*function\s+\w+"), "function"),
+    (re.compile(r"^\s*(import|from)\s+"), "import"),
+    (re.compile(r"^\s*@\w+"), "decorator"),
+    (re.compile(r"^\s*(public|private|protected)\s+class\s+\w+"), "class"),
+    (re.compile(r"^\s*(public|private|protected)?\s*(static)?\s*\w+\s*\("), "function"),
 ]
 
+# CODE_PATTERNS fused into one alternation so each line is scanned once; alternatives are tried in order, so the
+# first matching pattern still wins. Each gets a named group, mapped back to its tag via CODE_PATTERN_TAGS.
+COMBINED_CODE_PATTERN: Pattern[str] = re.compile(
+    "|".join(f"(?P<{tag}_{index}>{pattern.pattern})" for index, (pattern, tag) in enumerate(CODE_PATTERNS))
+)
+CODE_PATTERN_TAGS: Mapping[str, str] = MappingProxyType(
+    {f"{tag}_{index}": tag for index, (_pattern, tag) in enumerate(CODE_PATTERNS)}
+)
+
 # Text patterns for markdown/text files
-TEXT_PATTERNS = [
-    (r"^#{1,6}\s+", "header"),
-    (r"^\s*[-*+]\s+", "list_item"),
-    (r"^\s*\d+\.\s+", "ordered_list"),
-    (r"^```", "code_block"),
-    (r"^\s*>", "quote"),
+TEXT_PATTERNS: List[Tuple[Pattern[str], str]] = [
+    (re.compile(r"^#{1,6}\s+"), "header"),
+    (re.compile(r"^\s*[-*+]\s+"), "list_item"),
+    (re.compile(r"^\s*\d+\.\s+"), "ordered_list"),
+    (re.compile(r"^```"), "code_block"),
+    (re.compile(r"^\s*>"), "quote"),
 ]
 
 # Configuration limits
@@ -238,4 +269,4 @@ MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 MAX_SIGNATURE_LINES = 3
 
 # Directories to ignore
-IGNORED_PATHS = {".deputydev", "__pycache__", ".git", "node_modules", ".venv", "venv"}
+IGNORED_PATHS: FrozenSet[str] = frozenset({".deputydev", "__pycache__", ".git", "node_modules", ".venv", "venv"})
@@ -1,10 +1,15 @@
 # Create a context variable that holds a dictionary
 
 import contextvars
-from typing import Any
+from typing import Any, Tuple
 
 context_var = contextvars.ContextVar("context_var", default={})
 
+# Request meta keys AppLogger merges into every log line; has_meta_context flips to True once any of them is set
+# so logging in contexts without request meta (e.g. CLI) can skip reading them
+META_CONTEXT_KEYS = frozenset(("team_id", "scm_pr_id", "repo_name", "request_id"))
+has_meta_context = contextvars.ContextVar("has_meta_context", default=False)
+
 # Function to get a value
 # Set multiple values
 # set_values(a=1, b=2, c=3)
@@ -26,6 +31,11 @@ def get_context_value(key: str):
     return context_var.get().get(key)
 
 
+# Get several values with a single read of the context variable
+def get_context_values(*keys: str) -> Tuple[Any, ...]:
+    return tuple(map(context_var.get().get, keys))
+
+
 # Function to set multiple values
 
 
@@ -36,3 +46,5 @@ def set_context_values(**kwargs: Any):
     current_values.update(kwargs)
     # Set the updated dictionary back to the context variable
     context_var.set(current_values)
+    if not META_CONTEXT_KEYS.isdisjoint(kwargs):
+        has_meta_context.set(True)
@@ -9,6 +9,8 @@ class CustomProgressBar:
         total_percentage (float): Total percentage of progress.
     """
 
+    __slots__ = ("completed", "current_batch_percentage", "total_files_to_process", "total_percentage")
+
     def __init__(self):
         """
         Initializes the progress bar with default values.
@@ -1,6 +1,12 @@
+from typing import Any, Dict, Optional
+
+
 class FileIndexingMonitor:
-    def __init__(self, files_with_indexing_status={}):
-        self.files_with_indexing_status = files_with_indexing_status
+    __slots__ = ("files_with_indexing_status",)
+
+    def __init__(self, files_with_indexing_status: Optional[Dict[str, Any]] = None) -> None:
+        # A fresh dict per monitor; a shared {} default would leak statuses between monitors
+        self.files_with_indexing_status = files_with_indexing_status if files_with_indexing_status is not None else {}
 
     def update_status(self, files_status):
         self.files_with_indexing_status.update(files_status)
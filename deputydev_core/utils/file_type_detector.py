@@ -1,3 +1,4 @@
+import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -20,11 +21,11 @@ class FileTypeDetector:
     @classmethod
     def should_ignore_file(cls, file_path: str) -> bool:
         """Check if file should be ignored."""
-        path = Path(file_path)
-        path_parts = path.parts
-        if any(ignored in path_parts for ignored in IGNORED_PATHS):
+        # Plain string splitting instead of a Path per file; altsep covers "/" in Windows paths like Path.parts does
+        normalized_path = file_path.replace(os.altsep, os.sep) if os.altsep else file_path
+        if not IGNORED_PATHS.isdisjoint(normalized_path.split(os.sep)):  # noqa: PTH206
             return True
-        ext = path.suffix.lower()
+        ext = os.path.splitext(os.path.basename(file_path))[1].lower()  # noqa: PTH119, PTH122
         return ext in BINARY_EXTENSIONS
 
     @classmethod
@@ -33,14 +34,14 @@ class FileTypeDetector:
         if not file_path:
             return None
 
-        ext = file_path.lower().split(".")[-1] if "." in file_path else ""
-        filename = file_path.lower().split("/")[-1] if "/" in file_path else file_path.lower()
+        # Only the basename is lowercased; the rest of the path is never scanned
+        filename = os.path.basename(file_path).lower()  # noqa: PTH119
 
         # Check special filenames first
         if filename in SPECIAL_FILENAME_MAP:
             return SPECIAL_FILENAME_MAP[filename]
 
-        return ALL_EXTENSIONS.get(ext)
+        return ALL_EXTENSIONS.get(os.path.splitext(filename)[1][1:])  # noqa: PTH122
 
     @classmethod
     def detect_file_type(cls, file_path: str, content_sample: str = "") -> FileType:
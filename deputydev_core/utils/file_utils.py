@@ -1,4 +1,11 @@
 from pathlib import Path
+from typing import Iterator
+
+from deputydev_core.utils.app_logger import AppLogger
+from deputydev_core.utils.constants.constants import MAX_FILE_SIZE
+
+# Read buffer for read_file_lines; large enough that big files are pulled in with few read() calls
+_READ_BUFFER_SIZE = 1 << 20
 
 
 def read_file(file_name: str) -> str:
@@ -9,14 +16,33 @@ def read_file(file_name: str) -> str:
         file_name (str): The path to the file to be read.
 
     Returns:
-        str: The content of the file.
+        str: The content of the file, or an empty string if it is larger than MAX_FILE_SIZE.
 
     Raises:
         SystemExit: If the file cannot be read due to a SystemExit exception.
     """
     try:
-        with Path(file_name).open("r", encoding="utf-8", errors="ignore") as f:
+        path = Path(file_name)
+        # Check the size before reading so oversized (often binary) files are never loaded into memory
+        if path.stat().st_size > MAX_FILE_SIZE:
+            AppLogger.log_warn(f"Skipping {file_name}: larger than {MAX_FILE_SIZE} bytes")
+            return ""
+        with path.open("r", encoding="utf-8", errors="ignore") as f:
             return f.read()
     except SystemExit:
         raise SystemExit
     return ""
+
+
+def read_file_lines(file_name: str) -> Iterator[str]:
+    """
+    Lazily yields the lines of a file, keeping memory constant regardless of file size.
+
+    Args:
+        file_name (str): The path to the file to be read.
+
+    Yields:
+        str: Each line of the file, including its trailing newline.
+    """
+    with Path(file_name).open("r", encoding="utf-8", errors="ignore", buffering=_READ_BUFFER_SIZE) as f:
+        yield from f
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
 import pydantic
 
@@ -14,6 +14,9 @@ from deputydev_core.utils.constants.constants import LocalDirectories, LocalFile
 class McpSettings:
     def __init__(self, mcp_config_path: str = None):
         self.mcp_config_path = McpSettings.get_mcp_settings_file_path(mcp_config_path)
+        # Last validated settings keyed by the file's (mtime_ns, size), so unchanged files skip parse + validation.
+        # Callers mutate the returned model, so only deep copies of the cached one are ever handed out.
+        self._cached_settings: Optional[Tuple[Tuple[int, int], McpSettingsModel]] = None
 
     @staticmethod
     def get_settings_file_path():
@@ -30,8 +33,16 @@ class McpSettings:
                 f.write(json.dumps({"mcp_servers": {}}))
         return mcp_config_path
 
+    def _settings_file_fingerprint(self) -> Tuple[int, int]:
+        stat_result = os.stat(self.mcp_config_path)  # noqa: PTH116
+        return stat_result.st_mtime_ns, stat_result.st_size
+
     def read_and_validate_mcp_settings_file(self) -> Optional[McpSettingsModel]:
         try:
+            fingerprint = self._settings_file_fingerprint()
+            if self._cached_settings is not None and self._cached_settings[0] == fingerprint:
+                return self._cached_settings[1].model_copy(deep=True)
+
             with open(self.mcp_config_path, "r") as f:
                 content = f.read()
 
@@ -45,6 +56,7 @@ class McpSettings:
             try:
                 # Validate against schema
                 mcp_settings = McpSettingsModel.model_validate(config)
+                self._cached_settings = (fingerprint, mcp_settings.model_copy(deep=True))
                 return mcp_settings
             except pydantic.ValidationError as e:
                 raise Exception(f"Invalid MCP settings schema: {str(e)} {config}")
@@ -69,3 +81,5 @@ class McpSettings:
         # Write back to file
         with open(self.mcp_config_path, "w") as f:
             json.dump(settings.model_dump(exclude_defaults=True), f, indent=2)
+        # Only reached once the write succeeded: the file now holds exactly these settings, so re-key the cache
+        self._cached_settings = (self._settings_file_fingerprint(), settings.model_copy(deep=True))
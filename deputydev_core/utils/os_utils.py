@@ -1,6 +1,7 @@
 import os
 import platform
 import shutil
+from functools import lru_cache
 
 from deputydev_core.utils.app_logger import AppLogger
 from deputydev_core.utils.constants.constants import SupportedPlatforms
@@ -8,22 +9,29 @@ from deputydev_core.utils.constants.constants import SupportedPlatforms
 
 def clean_directory_except(target_dir: str, except_path: str):
     try:
-        for item in os.listdir(target_dir):
-            item_path = os.path.join(target_dir, item)
-            # Skip the item to preserve
-            if os.path.abspath(item_path) == os.path.abspath(except_path):
-                continue
+        except_abs_path = os.path.abspath(except_path)
+        # Resolved once; entries are then compared by joining their names onto it instead of resolving each one
+        target_abs_path = os.path.abspath(target_dir)
+        # scandir entries carry the file type from the directory read, so no extra stat per item
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                # Skip the item to preserve
+                if os.path.join(target_abs_path, entry.name) == except_abs_path:
+                    continue
 
-            if os.path.isfile(item_path) or os.path.islink(item_path):
-                os.remove(item_path)
-            elif os.path.isdir(item_path):
-                shutil.rmtree(item_path)
+                if entry.is_symlink() or entry.is_file(follow_symlinks=False):
+                    os.remove(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
     except Exception as e:
         AppLogger.log_debug(f"Error cleaning directory - {target_dir}: {str(e)}")
 
 
+# The platform cannot change while the process runs, so platform.system() is only consulted once
+@lru_cache(maxsize=1)
 def get_supported_os() -> SupportedPlatforms:
+    system = platform.system().lower()
     try:
-        return SupportedPlatforms(platform.system().lower())
+        return SupportedPlatforms(system)
     except Exception:
-        raise RuntimeError(f"Unsupported OS: {platform.system().lower()}")
+        raise RuntimeError(f"Unsupported OS: {system}")
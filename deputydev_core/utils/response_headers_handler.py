@@ -1,6 +1,9 @@
+import logging
 from functools import wraps
 from typing import Any, Awaitable, Callable, Dict, Optional
 
+logger = logging.getLogger(__name__)
+
 
 def handle_response_headers(
     func: Callable[..., Awaitable[Dict[str, Any]]],
@@ -8,8 +11,11 @@ def handle_response_headers(
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Optional[Dict[str, Any]]:
         result, response_headers = await func(*args, **kwargs)
-        if response_headers.get("new_session_data"):
-            print(response_headers.get("new_session_data"))
+        # Level check first so the header lookup is skipped entirely when debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            new_session_data = response_headers.get("new_session_data")
+            if new_session_data:
+                logger.debug("new_session_data=%s", new_session_data)
         return result
 
     return wrapper
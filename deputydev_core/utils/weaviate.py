@@ -1,15 +1,25 @@
-from sanic import Sanic
-
-from deputydev_core.services.initialization.initialization_service import (
-    InitializationManager,
-)
-from deputydev_core.services.repository.dataclasses.main import (
-    WeaviateSyncAndAsyncClients,
-)
+import asyncio
+from typing import TYPE_CHECKING
+
 from deputydev_core.utils.app_logger import AppLogger
 
+# Only needed for annotations; importing them here would pull Sanic and the whole initialization/vector-store
+# stack into every process that imports this module
+if TYPE_CHECKING:
+    from deputydev_core.services.initialization.initialization_service import (
+        InitializationManager,
+    )
+    from deputydev_core.services.repository.dataclasses.main import (
+        WeaviateSyncAndAsyncClients,
+    )
+
+# Caps in-flight collection deletes so a large schema doesn't exhaust the client's connection pool
+_MAX_CONCURRENT_DELETES = 16
+
 
 async def weaviate_connection():
+    from sanic import Sanic  # deferred: only servers running under Sanic reach this
+
     app = Sanic.get_app()
     if not hasattr(app.ctx, "weaviate_client"):
         return
@@ -25,7 +35,7 @@ async def weaviate_connection():
 
 
 async def get_weaviate_client(
-    initialization_manager: InitializationManager,
+    initialization_manager: "InitializationManager",
 ) -> "WeaviateSyncAndAsyncClients":
     weaviate_client = await weaviate_connection()
     if weaviate_client:
@@ -40,16 +50,20 @@ async def get_weaviate_client(
 
 
 async def clean_weaviate_collections(
-    initialization_manager: InitializationManager,
+    initialization_manager: "InitializationManager",
 ) -> None:
     """
-    Cleans all collections from Weaviate using the sync client.
+    Cleans all collections from Weaviate, deleting them concurrently through the async client.
     Initializes the vector DB clients if not already available.
     """
     weaviate_client = await get_weaviate_client(initialization_manager)
 
-    if not weaviate_client.sync_client:
-        raise ValueError("Weaviate sync client is not initialized")
+    collection_names = await weaviate_client.async_client.collections.list_all(simple=True)
+    AppLogger.log_debug(f"Cleaning up {len(collection_names)} Weaviate collections")
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_DELETES)
+
+    async def delete_collection(name: str) -> None:
+        async with sem:
+            await weaviate_client.async_client.collections.delete(name)
 
-    AppLogger.log_debug("Cleaning up Weaviate sync collections")
-    weaviate_client.sync_client.collections.delete_all()
+    await asyncio.gather(*(delete_collection(name) for name in collection_names))